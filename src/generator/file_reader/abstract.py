@@ -1,4 +1,8 @@
+import asyncio
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from typing import Optional
+
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 
 
@@ -8,6 +12,8 @@ class FileReader(ABC):
     This class provides a template for reading files of various types.
     It includes methods to verify the file extension, read the file,
     process the file content, and store the processed content for later use.
+    Construction does no I/O: the file is read on the first call to `load`,
+    `aread` or `get_content`.
     """
 
     def __init__(self, file_path: str):
@@ -49,17 +55,49 @@ class FileReader(ABC):
         """
         pass
 
-    def get_content(self) -> str:
-        """Get the processed content of the file.
+    def read_content(self) -> str:
+        """Read the file and process its content without storing it.
+
+        Returns:
+            str: The processed content of the file.
+        """
+        return self.process_content(self.read_file())
+
+    def load(self) -> str:
+        """Read and process the file, storing the result as its content.
 
         Returns:
             str: The processed content of the file.
         """
+        self.content = self.read_content()
         return self.content
 
+    async def aread(self, executor: Optional[Executor] = None) -> str:
+        """Read and process the file without blocking the event loop.
+
+        Args:
+            executor (Optional[Executor]): The thread or process pool that does
+                the blocking work. Default is the event loop's thread pool.
+
+        Returns:
+            str: The processed content of the file.
+        """
+        loop = asyncio.get_running_loop()
+        self.content = await loop.run_in_executor(executor, self.read_content)
+        return self.content
+
+    def get_content(self) -> str:
+        """Get the processed content of the file, reading it if needed.
+
+        Returns:
+            str: The processed content of the file.
+        """
+        if self.content is None:
+            self.load()
+        return self.content
 
     def get_chunks(self, chunk_size: int = 1000, chunk_overlap: int = 200):
-        """Get the content of the file in chunks.
+        """Get the content of the file in chunks, reading it if needed.
 
         Args:
             chunk_size (int): The size of each chunk. Default is 1000 characters.
@@ -68,16 +106,15 @@ class FileReader(ABC):
         Yields:
             str: A chunk of the processed content.
         """
-        if self.content is None:
-            raise ValueError("Content is not available. Please read and process the file first.")
-        
+        content = self.get_content()
+
         text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
             length_function=len,
             is_separator_regex=False,
         )
-        chunks = text_splitter.split_text(self.content)
+        chunks = text_splitter.split_text(content)
         
         for chunk in chunks:
             yield chunk
\ No newline at end of file
@@ -1,4 +1,5 @@
-import pypdf
+import fitz  # PyMuPDF
+
 from src.generator.file_reader.abstract import FileReader
 
 
@@ -19,13 +20,8 @@ class PDFReader(FileReader):
         Returns:
             str: The content of the PDF file as a string.
         """
-        content = ""
-        with open(self.file_path, 'rb') as file:
-            reader = pypdf.PdfReader(file)
-            for page_num in range(reader.numPages):
-                page = reader.getPage(page_num)
-                content += page.extract_text()
-        return content
+        with fitz.open(self.file_path) as doc:
+            return "".join(page.get_text() for page in doc)
 
     def process_content(self, content: str) -> str:
         """Process the content of the PDF file if needed.
@@ -40,9 +36,14 @@ class PDFReader(FileReader):
         return content
 
     def __init__(self, file_path: str):
+        """Initialize the reader without reading the file.
+
+        Args:
+            file_path (str): The path to the .pdf file to be read.
+
+        Raises:
+            ValueError: If the file extension is not .pdf.
+        """
         super().__init__(file_path)
-        if self.verify_extension():
-            raw_content = self.read_file()
-            self.content = self.process_content(raw_content)
-        else:
-            raise ValueError("Unsupported file extension. Only .pdf files are supported.")
\ No newline at end of file
+        if not self.verify_extension():
+            raise ValueError("Unsupported file extension. Only .pdf files are supported.")
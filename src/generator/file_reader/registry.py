@@ -0,0 +1,45 @@
+import os
+from typing import Dict, Type
+
+from src.generator.file_reader.abstract import FileReader
+from src.generator.file_reader.pdf_reader import PDFReader
+from src.generator.file_reader.txt_reader import TXTReader
+
+READERS: Dict[str, Type[FileReader]] = {
+    ".pdf": PDFReader,
+    ".txt": TXTReader,
+}
+
+
+def register_reader(extension: str, reader_cls: Type[FileReader]) -> None:
+    """Register a FileReader class for a file extension.
+
+    Args:
+        extension (str): The file extension handled by the reader, e.g. ".md".
+        reader_cls (Type[FileReader]): The FileReader class to register.
+    """
+    READERS[extension.lower()] = reader_cls
+
+
+def get_reader(file_path: str) -> FileReader:
+    """Get a reader for the file based on its extension.
+
+    The reader is constructed lazily, so no I/O happens until its content is
+    requested through `load`, `aread` or `get_content`.
+
+    Args:
+        file_path (str): The path to the file to be read.
+
+    Returns:
+        FileReader: The reader registered for the file extension.
+
+    Raises:
+        ValueError: If no reader is registered for the file extension.
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension not in READERS:
+        raise ValueError(
+            f"Unsupported file extension '{extension}'. "
+            f"Supported extensions are: {', '.join(sorted(READERS))}."
+        )
+    return READERS[extension](file_path)
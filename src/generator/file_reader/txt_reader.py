@@ -34,9 +34,14 @@ class TXTReader(FileReader):
         return content
 
     def __init__(self, file_path: str):
+        """Initialize the reader without reading the file.
+
+        Args:
+            file_path (str): The path to the .txt file to be read.
+
+        Raises:
+            ValueError: If the file extension is not .txt.
+        """
         super().__init__(file_path)
-        if self.verify_extension():
-            raw_content = self.read_file()
-            self.content = self.process_content(raw_content)
-        else:
-            raise ValueError("Unsupported file extension. Only .txt files are supported.")
\ No newline at end of file
+        if not self.verify_extension():
+            raise ValueError("Unsupported file extension. Only .txt files are supported.")
@@ -1,6 +1,16 @@
 import asyncio
 import os
-from typing import Any, Dict, List, Literal, TypedDict
+import uuid
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    TypedDict,
+)
 
 from dotenv import load_dotenv
 from langchain_core.output_parsers import JsonOutputParser, StrOutputParser
@@ -10,11 +20,13 @@ from langchain_openai import ChatOpenAI
 from langgraph.constants import Send
 from langgraph.graph import END, START, StateGraph
 
+from src.generator.file_reader.registry import get_reader
 from src.prompts.prompts import prompts
+from src.utils.profiling import profile_node
 from src.utils.utils import (
+    assemble_chapters,
     calculate_word_counts,
     convert_markdown_to_pdf,
-    extract_text_from_pdf,
     should_refine_chapters,
 )
 
@@ -44,29 +56,58 @@ class TranscriptPipeline:
         api_key (str): The API key for the OpenAI API.
         llm (ChatOpenAI): The OpenAI language model for generating content.
         graph (StateGraph): The state graph for the pipeline.
+        profile_dir (Optional[str]): The directory where node profiles are
+            stored, or None when profiling is disabled.
     """
 
-    def __init__(self, start_state: Dict[str, Any]):
+    def __init__(
+        self, start_state: Dict[str, Any], profile_dir: Optional[str] = None
+    ):
         """Initialize the TranscriptPipeline with the given start state.
 
         Args:
             start_state (Dict[str, Any]): The initial state of the pipeline, including API key and other configurations.
+            profile_dir (Optional[str]): If given, every node is profiled with
+                cProfile and tracemalloc, one profile per node execution is
+                dumped into this directory and a summary is printed.
         """
         self.start_state = start_state
+        self.profile_dir = profile_dir
         self.api_key = os.getenv("OPENAI_API_KEY")
         self.llm = ChatOpenAI(model="gpt-4o-mini", api_key=self.api_key)
         self.graph = StateGraph(State)
         self._build_pipeline()
 
+    def _profiled(self, name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a node with the profiler when profiling is enabled.
+
+        Args:
+            name (str): The name of the node.
+            func (Callable[..., Any]): The node function.
+
+        Returns:
+            Callable[..., Any]: The node function, profiled if enabled.
+        """
+        if self.profile_dir is None:
+            return func
+        return profile_node(name, func, self.profile_dir)
+
     def _build_pipeline(self):
         """Build the state graph pipeline by adding nodes and edges."""
-        self.graph.add_node("extract_text_from_pdf", self.extract_text_from_pdf)
-        self.graph.add_node("generate_content_table", self.generate_content_table)
-        self.graph.add_node("assign_word_counts", self.assign_word_counts)
-        self.graph.add_node("fill_each_chapter", self.fill_each_chapter)
-        self.graph.add_node("assemble_final_document", self.assemble_final_document)
-        self.graph.add_node("refine_chapter", self.refine_chapter)
-        self.graph.add_node("save_as_pdf", self.save_as_pdf)
+        nodes = {
+            "extract_text_from_pdf": self.extract_text_from_pdf,
+            "generate_content_table": self.generate_content_table,
+            "assign_word_counts": self.assign_word_counts,
+            "fill_each_chapter": self.fill_each_chapter,
+            "assemble_final_document": self.assemble_final_document,
+            "refine_chapter": self.refine_chapter,
+            "save_as_pdf": self.save_as_pdf,
+        }
+        for name, node in nodes.items():
+            self.graph.add_node(name, self._profiled(name, node))
+        should_refine_chapter = self._profiled(
+            "should_refine_chapter", self.should_refine_chapter
+        )
 
         self.graph.add_edge(START, "extract_text_from_pdf")
         self.graph.add_edge("extract_text_from_pdf", "generate_content_table")
@@ -75,15 +116,16 @@ class TranscriptPipeline:
         self.graph.add_edge("assemble_final_document", "save_as_pdf")
         self.graph.add_edge("save_as_pdf", END)
 
-        self.graph.add_conditional_edges(
-            "fill_each_chapter", self.should_refine_chapter
-        )
-        self.graph.add_conditional_edges("refine_chapter", self.should_refine_chapter)
+        self.graph.add_conditional_edges("fill_each_chapter", should_refine_chapter)
+        self.graph.add_conditional_edges("refine_chapter", should_refine_chapter)
 
-    def extract_text_from_pdf(
+    async def extract_text_from_pdf(
         self, state: Dict[str, Any], config: RunnableConfig
     ) -> Dict[str, Any]:
-        """Extract text from a PDF file.
+        """Extract text from the input file.
+
+        The file is parsed by the reader registered for its extension, in a
+        worker thread so the event loop is not blocked.
 
         Args:
             state (Dict[str, Any]): The current state of the pipeline.
@@ -92,8 +134,9 @@ class TranscriptPipeline:
         Returns:
             Dict[str, Any]: The updated state with extracted text.
         """
-        text = extract_text_from_pdf(state["pdf_path"])
-        return {"text": text}
+        reader = get_reader(state["pdf_path"])
+        text = await reader.aread()
+        return {"text": text.strip()}
 
     def generate_content_table(
         self, state: Dict[str, Any], config: RunnableConfig
@@ -153,7 +196,9 @@ class TranscriptPipeline:
         topics = state["content_table"]
         for chapter, words in state["word_counts"].items():
             prompt = ChatPromptTemplate(prompts["fill_each_chapter"])
-            fill_chapter_chain = prompt | self.llm | StrOutputParser()
+            fill_chapter_chain = (prompt | self.llm | StrOutputParser()).with_config(
+                run_name=chapter, metadata={"chapter": chapter}
+            )
             chapters[chapter] = fill_chapter_chain.ainvoke(
                 {
                     "context": state["text"],
@@ -207,10 +252,12 @@ class TranscriptPipeline:
         for chapter in chapters_to_refine:
             current_words = len(state["chapters"][chapter].split())
             prompt = ChatPromptTemplate(prompts["refine_chapter"])
-            refine_chain = prompt | self.llm | StrOutputParser()
+            refine_chain = (prompt | self.llm | StrOutputParser()).with_config(
+                run_name=chapter, metadata={"chapter": chapter}
+            )
             temp_chapter[chapter] = refine_chain.ainvoke(
                 {
-                    "context": state["chapters"][chapter],
+                    "chapter_content": state["chapters"][chapter],
                     "chapter": chapter,
                     "current_words": current_words,
                     "required_words": state["word_counts"][chapter],
@@ -220,8 +267,10 @@ class TranscriptPipeline:
                 config,
             )
         results = await asyncio.gather(*temp_chapter.values())
+        chapters = dict(state["chapters"])
         for chapter, result in zip(temp_chapter.keys(), results):
-            state["chapters"][chapter] = result
+            chapters[chapter] = result
+        return {"chapters": chapters}
 
     def assemble_final_document(
         self, state: Dict[str, Any], config: RunnableConfig
@@ -235,9 +284,7 @@ class TranscriptPipeline:
         Returns:
             Dict[str, Any]: The updated state with the assembled final document.
         """
-        final_document = "\n\n".join(
-            f"{content}" for _, content in state["chapters"].items()
-        )
+        final_document = assemble_chapters(state["chapters"], state["word_counts"])
         return {"final_document": final_document}
 
     def save_as_pdf(self, state: Dict[str, Any], config: RunnableConfig):
@@ -249,6 +296,49 @@ class TranscriptPipeline:
         """
         convert_markdown_to_pdf(state["final_document"], "output_file.pdf")
 
+    async def astream_chapters(
+        self, state: Dict[str, Any]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Run the pipeline and stream chapter tokens as they are generated.
+
+        Chapter chains are tagged with their chapter title, so the tokens of
+        the concurrent chapter calls can be told apart while they interleave.
+        Each call gets its own ``run_id`` metadata, which groups its profiles
+        when profiling is enabled.
+
+        Args:
+            state (Dict[str, Any]): The initial state of the pipeline.
+
+        Yields:
+            Dict[str, Any]: Either a ``{"type": "token", "node", "chapter",
+                "content"}`` event for every generated chapter token, or a
+                ``{"type": "node_end", "node", "output"}`` event when a
+                pipeline step finishes.
+        """
+        config = {"metadata": {"run_id": str(uuid.uuid4())}}
+        async for event in self.app.astream_events(state, config, version="v2"):
+            metadata = event.get("metadata", {})
+            node = metadata.get("langgraph_node")
+            if event["event"] == "on_chat_model_stream" and "chapter" in metadata:
+                content = event["data"]["chunk"].content
+                if content:
+                    yield {
+                        "type": "token",
+                        "node": node,
+                        "chapter": metadata["chapter"],
+                        "content": content,
+                    }
+            elif (
+                event["event"] == "on_chain_end"
+                and event["name"] == node
+                and node in self.graph.nodes
+            ):
+                yield {
+                    "type": "node_end",
+                    "node": node,
+                    "output": event["data"].get("output"),
+                }
+
     @property
     def app(self):
         """Get the Streamlit app for the pipeline.
@@ -0,0 +1,181 @@
+import asyncio
+import contextvars
+import cProfile
+import functools
+import inspect
+import io
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+import weakref
+from typing import Any, Callable, Optional, Tuple
+
+from langchain_core.runnables.config import ensure_config
+
+# Profiled calls currently tracing allocations, tracemalloc is stopped when the
+# last one ends if it was started here.
+_tracemalloc_lock = threading.Lock()
+_tracemalloc_users = 0
+_tracemalloc_started = False
+
+# cProfile binds to the thread that enables it, so profiled coroutines sharing
+# an event loop would override each other; they run one at a time instead.
+_loop_locks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# Set while a profiled coroutine runs, tasks it spawns inherit it.
+_in_profiled_coroutine = contextvars.ContextVar(
+    "in_profiled_coroutine", default=False
+)
+
+
+def _loop_lock() -> asyncio.Lock:
+    """Get the lock serializing profiled coroutines on the running loop."""
+    loop = asyncio.get_running_loop()
+    if loop not in _loop_locks:
+        _loop_locks[loop] = asyncio.Lock()
+    return _loop_locks[loop]
+
+
+def _run_id() -> str:
+    """Get the id of the graph run the current call belongs to."""
+    config = ensure_config()
+    run_id = config["metadata"].get("run_id")
+    if run_id is None:
+        run_id = config.get("configurable", {}).get("thread_id", "default")
+    return str(run_id)
+
+
+def _start_tracemalloc() -> None:
+    """Start tracing allocations unless another caller already does."""
+    global _tracemalloc_users, _tracemalloc_started
+    with _tracemalloc_lock:
+        if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracemalloc_started = True
+        _tracemalloc_users += 1
+
+
+def _stop_tracemalloc() -> None:
+    """Stop tracing allocations if this module started it and nobody uses it."""
+    global _tracemalloc_users, _tracemalloc_started
+    with _tracemalloc_lock:
+        _tracemalloc_users -= 1
+        if _tracemalloc_users == 0 and _tracemalloc_started:
+            tracemalloc.stop()
+            _tracemalloc_started = False
+
+
+def _start_profiling(
+    name: str,
+) -> Tuple[Optional[cProfile.Profile], tracemalloc.Snapshot]:
+    """Start tracing allocations and profiling the current call."""
+    _start_tracemalloc()
+    snapshot = tracemalloc.take_snapshot()
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Python 3.12+ allows a single active profiler per interpreter.
+        print(f"[profile] {name} skipped: another profiler is already active")
+        return None, snapshot
+    return profiler, snapshot
+
+
+def _stop_profiling(
+    name: str,
+    profiler: Optional[cProfile.Profile],
+    snapshot_before: tracemalloc.Snapshot,
+    profile_dir: str,
+    top: int,
+) -> None:
+    """Dump the profile of a node execution and print its hotspots."""
+    if profiler is None:
+        _stop_tracemalloc()
+        return
+    profiler.disable()
+    snapshot_after = tracemalloc.take_snapshot()
+    _stop_tracemalloc()
+    # Leave the profiler's own bookkeeping out of the allocation summary
+    filters = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    )
+    run_dir = os.path.join(profile_dir, _run_id())
+    os.makedirs(run_dir, exist_ok=True)
+    profile_path = os.path.join(run_dir, f"{name}_{time.time_ns()}.prof")
+    profiler.dump_stats(profile_path)
+
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    allocations = snapshot_after.filter_traces(filters).compare_to(
+        snapshot_before.filter_traces(filters), "lineno"
+    )[:top]
+
+    print(f"[profile] {name} -> {profile_path}")
+    print(f"[profile] {name} hottest functions:")
+    print(stream.getvalue())
+    print(f"[profile] {name} top allocations:")
+    for allocation in allocations:
+        print(f"    {allocation}")
+
+
+def profile_node(
+    name: str,
+    func: Callable[..., Any],
+    profile_dir: str,
+    top: int = 10,
+) -> Callable[..., Any]:
+    """Wrap a pipeline node with cProfile and tracemalloc.
+
+    Every call of the wrapped node dumps a ``.prof`` file into
+    ``profile_dir/<run_id>`` and prints a summary of its hottest functions and
+    top allocations. The run id is taken from the ``run_id`` metadata of the
+    run config, then its ``thread_id``, and defaults to ``"default"``.
+
+    Coroutine functions stay coroutine functions, and the original signature
+    is kept so the graph still passes the node its config. Profiled coroutines
+    on the same event loop run one at a time, so concurrent runs are
+    serialized while profiling. Nested profiled coroutines are not supported:
+    the inner one runs unprofiled and a message is printed. Work offloaded to
+    other threads or processes is not part of the profile.
+
+    Args:
+        name (str): The name of the node, used for the output file.
+        func (Callable[..., Any]): The node function to profile.
+        profile_dir (str): The directory where the profiles are stored.
+        top (int): The number of functions and allocations to print. Default is 10.
+
+    Returns:
+        Callable[..., Any]: The profiled node function.
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            if _in_profiled_coroutine.get():
+                # Waiting for the lock held by the outer coroutine would hang
+                print(f"[profile] {name} skipped: nested in a profiled coroutine")
+                return await func(*args, **kwargs)
+            async with _loop_lock():
+                token = _in_profiled_coroutine.set(True)
+                profiler, snapshot = _start_profiling(name)
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    _stop_profiling(name, profiler, snapshot, profile_dir, top)
+                    _in_profiled_coroutine.reset(token)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        profiler, snapshot = _start_profiling(name)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _stop_profiling(name, profiler, snapshot, profile_dir, top)
+
+    return wrapper
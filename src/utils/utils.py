@@ -1,20 +1,16 @@
 import markdown
 from weasyprint import HTML
-from typing import Dict, Any, List
-
-import fitz  # PyMuPDF
-
-def extract_text_from_pdf(pdf_path: str) -> str:
-    """Extract text from a PDF file."""
-    doc = fitz.open(pdf_path)
-    text = "".join(page.get_text() for page in doc)
-    return text.strip()
+from typing import Dict, Any, Iterable, List
 
 def convert_markdown_to_pdf(markdown_content: str, output_path: str) -> None:
     """Convert Markdown content to a PDF file."""
     html_content = markdown.markdown(markdown_content)
     HTML(string=html_content).write_pdf(output_path)
 
+def assemble_chapters(chapters: Dict[str, str], order: Iterable[str]) -> str:
+    """Join the chapters into a markdown document following the given order."""
+    return "\n\n".join(chapters[chapter] for chapter in order)
+
 def calculate_word_counts(content_table: Dict[str, Any], required_words: int) -> Dict[str, int]:
     """Calculate word counts for each chapter based on their importance."""
     word_counts = {
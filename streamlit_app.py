@@ -33,16 +33,42 @@ if st.button("Generate Transcript"):
 
             initial_state = {"pdf_path": str(pdf_path), "required_words": word_count, "instruction": instruction}
             pipeline = TranscriptPipeline(initial_state)
-            pipeline_app = pipeline.app
             steps_completed = tuple()
-            total_steps = 5
+            total_steps = 6
 
-            async for step in pipeline_app.astream(initial_state):
-                steps_completed += (list(step.keys())[0],)
+            # Chapters are rendered as their tokens arrive, the downloads use
+            # the document assembled by the pipeline
+            final_document = ""
+            chapters = {}
+            placeholders = {}
+            refining = set()
+
+            async for event in pipeline.astream_chapters(initial_state):
+                if event["type"] == "token":
+                    chapter = event["chapter"]
+                    if event["node"] == "refine_chapter" and chapter not in refining:
+                        refining.add(chapter)
+                        chapters[chapter] = ""
+                    chapters[chapter] = chapters.get(chapter, "") + event["content"]
+                    if chapter not in placeholders:
+                        placeholders[chapter] = st.empty()
+                    placeholders[chapter].markdown(chapters[chapter])
+                    continue
+
+                if event["node"] == "assign_word_counts":
+                    for chapter in event["output"]["word_counts"]:
+                        placeholders[chapter] = st.empty()
+                elif event["node"] == "refine_chapter":
+                    refining.clear()
+                elif event["node"] == "assemble_final_document":
+                    final_document = event["output"]["final_document"]
+                steps_completed += (event["node"],)
                 progress_bar.progress(min((len(steps_completed) / total_steps), 1))
 
+            return final_document
+
         # Run the pipeline
-        asyncio.run(run_pipeline())
+        final_document = asyncio.run(run_pipeline())
 
         # Display the generated PDF
         st.success("Transcript generated successfully!")
@@ -53,5 +79,11 @@ if st.button("Generate Transcript"):
                 file_name="output_file.pdf",
                 mime="application/pdf",
             )
+        st.download_button(
+            label="Download Markdown",
+            data=final_document,
+            file_name="output_file.md",
+            mime="text/markdown",
+        )
     else:
         st.error("Please provide an instruction and upload a PDF file.")
\ No newline at end of file
@@ -1,42 +1,61 @@
+import asyncio
 import unittest
-from unittest.mock import MagicMock, mock_open, patch
+from unittest.mock import MagicMock, patch
 
 from src.generator.file_reader.pdf_reader import PDFReader
+from src.generator.file_reader.registry import get_reader
+
+EXAMPLE_PDF = "example_data/Practical Test v2.pdf"
 
 
 class TestPDFReader(unittest.TestCase):
 
-    @patch("builtins.open", new_callable=mock_open, read_data=b"dummy data")
-    @patch("pypdf.PdfReader")
-    def test_verify_extension(self, mock_pdf_reader, mock_file):
+    def test_verify_extension(self):
         reader = PDFReader("dummy.pdf")
         self.assertTrue(reader.verify_extension())
 
-    @patch("builtins.open", new_callable=mock_open, read_data=b"dummy data")
-    @patch("pypdf.PdfReader")
-    def test_read_file(self, mock_pdf_reader, mock_file):
-        mock_pdf = MagicMock()
-        mock_pdf.numPages = 1
-        mock_pdf.getPage.return_value.extract_text.return_value = "Page content"
-        mock_pdf_reader.return_value = mock_pdf
+    @patch("fitz.open")
+    def test_read_file(self, mock_fitz_open):
+        mock_page = MagicMock()
+        mock_page.get_text.return_value = "Page content"
+        mock_fitz_open.return_value.__enter__.return_value = [mock_page]
 
         reader = PDFReader("dummy.pdf")
         content = reader.read_file()
         self.assertEqual(content, "Page content")
 
-    @patch("builtins.open", new_callable=mock_open, read_data=b"dummy data")
-    @patch("pypdf.PdfReader")
-    def test_process_content(self, mock_pdf_reader, mock_file):
+    def test_process_content(self):
         reader = PDFReader("dummy.pdf")
         processed_content = reader.process_content("Some content")
         self.assertEqual(processed_content, "Some content")
 
     def test_init_with_valid_extension(self):
+        with patch.object(PDFReader, 'read_file', return_value="Raw content") as mock_read:
+            reader = PDFReader("dummy.pdf")
+            mock_read.assert_not_called()
+            self.assertIsNone(reader.content)
+
+    def test_load(self):
         with patch.object(PDFReader, 'read_file', return_value="Raw content"):
             with patch.object(PDFReader, 'process_content', return_value="Processed content"):
                 reader = PDFReader("dummy.pdf")
+                self.assertEqual(reader.load(), "Processed content")
                 self.assertEqual(reader.content, "Processed content")
 
+    def test_aread(self):
+        with patch.object(PDFReader, 'read_file', return_value="Raw content"):
+            reader = PDFReader("dummy.pdf")
+            self.assertEqual(asyncio.run(reader.aread()), "Raw content")
+            self.assertEqual(reader.content, "Raw content")
+
+    def test_aread_example_pdf(self):
+        reader = get_reader(EXAMPLE_PDF)
+        self.assertIsInstance(reader, PDFReader)
+        content = asyncio.run(reader.aread())
+        self.assertIn("Site Reliability Engineering at Google", content)
+        self.assertIn("And Bjorn has mentioned a lot of things", content)
+        self.assertEqual(reader.content, content)
+
     def test_init_with_invalid_extension(self):
         with self.assertRaises(ValueError):
             PDFReader("dummy.txt")
@@ -0,0 +1,47 @@
+import unittest
+
+from src.generator.file_reader.abstract import FileReader
+from src.generator.file_reader.pdf_reader import PDFReader
+from src.generator.file_reader.registry import READERS, get_reader, register_reader
+from src.generator.file_reader.txt_reader import TXTReader
+
+
+class MarkdownReader(FileReader):
+    """Concrete implementation of FileReader for testing purposes."""
+
+    def verify_extension(self) -> bool:
+        return self.file_path.endswith('.md')
+
+    def read_file(self) -> str:
+        return "# dummy content"
+
+    def process_content(self, content: str) -> str:
+        return content
+
+
+class TestRegistry(unittest.TestCase):
+    def test_get_reader_by_extension(self):
+        self.assertIsInstance(get_reader("dummy.pdf"), PDFReader)
+        self.assertIsInstance(get_reader("dummy.txt"), TXTReader)
+
+    def test_get_reader_is_case_insensitive(self):
+        self.assertIsInstance(get_reader("DUMMY.PDF"), PDFReader)
+
+    def test_get_reader_does_not_read(self):
+        reader = get_reader("missing.pdf")
+        self.assertIsNone(reader.content)
+
+    def test_get_reader_unsupported_extension(self):
+        with self.assertRaises(ValueError):
+            get_reader("dummy.docx")
+
+    def test_register_reader(self):
+        register_reader(".md", MarkdownReader)
+        self.addCleanup(READERS.pop, ".md")
+        reader = get_reader("notes.md")
+        self.assertIsInstance(reader, MarkdownReader)
+        self.assertEqual(reader.get_content(), "# dummy content")
+
+
+if __name__ == "__main__":
+    unittest.main()
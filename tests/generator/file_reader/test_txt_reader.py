@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 
 from src.generator.file_reader.txt_reader import TXTReader
@@ -26,12 +27,29 @@ class TestTXTReader(unittest.TestCase):
         with open("test.txt", "w", encoding="utf-8") as file:
             file.write("Hello, world!")
         reader = TXTReader("test.txt")
-        self.assertEqual(reader.content, "Hello, world!")
+        self.assertIsNone(reader.content)
+        self.assertEqual(reader.get_content(), "Hello, world!")
+
+    def test_aread(self):
+        reader = TXTReader("tests/generator/file_reader/example.txt")
+        self.assertEqual(asyncio.run(reader.aread()), "Sample content")
+        self.assertEqual(reader.content, "Sample content")
+
+    def test_init_does_not_read(self):
+        reader = TXTReader("missing.txt")
+        self.assertIsNone(reader.content)
+        with self.assertRaises(FileNotFoundError):
+            reader.load()
 
     def test_init_with_invalid_file(self):
         with self.assertRaises(ValueError):
             TXTReader("tests/generator/file_reader/example.invtxt")
 
+    def test_get_chunks_reads_file(self):
+        reader = TXTReader("tests/generator/file_reader/example.txt")
+        self.assertEqual(list(reader.get_chunks()), ["Sample content"])
+        self.assertEqual(reader.content, "Sample content")
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,140 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from src.generator.pipeline_manager.pipeline import TranscriptPipeline
+
+START_STATE = {
+    "pdf_path": "tests/generator/file_reader/example.txt",
+    "required_words": 20,
+    "instruction": "dummy instruction",
+}
+RESPONSES = [
+    '{"Chapter 1": ["topic a"], "Chapter 2": ["topic b"]}',
+    '{"Chapter 1": 0.5, "Chapter 2": 0.5}',
+    "short one",
+    "short two",
+    "refined chapter with ten words in it for the test",
+    "refined chapter with ten words in it for the test",
+]
+REFINED = RESPONSES[-1]
+
+
+@patch("src.generator.pipeline_manager.pipeline.convert_markdown_to_pdf")
+class TestAstreamChapters(unittest.TestCase):
+    def stream(self, pipeline):
+        async def collect():
+            return [event async for event in pipeline.astream_chapters(START_STATE)]
+
+        return asyncio.run(collect())
+
+    def setUp(self):
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "dummy"}):
+            self.pipeline = TranscriptPipeline(START_STATE)
+        self.pipeline.llm = FakeListChatModel(responses=RESPONSES)
+
+    def test_tokens_grouped_by_chapter(self, mock_convert):
+        events = self.stream(self.pipeline)
+        filled = {}
+        for event in events:
+            if event["type"] == "token" and event["node"] == "fill_each_chapter":
+                filled[event["chapter"]] = filled.get(event["chapter"], "") + event["content"]
+        self.assertEqual(set(filled), {"Chapter 1", "Chapter 2"})
+        self.assertEqual(set(filled.values()), {"short one", "short two"})
+
+    def test_refine_tokens_replace_chapter(self, mock_convert):
+        events = self.stream(self.pipeline)
+        chapters = {}
+        refining = set()
+        for event in events:
+            if event["type"] == "token":
+                chapter = event["chapter"]
+                if event["node"] == "refine_chapter" and chapter not in refining:
+                    refining.add(chapter)
+                    chapters[chapter] = ""
+                chapters[chapter] = chapters.get(chapter, "") + event["content"]
+        self.assertEqual(chapters, {"Chapter 1": REFINED, "Chapter 2": REFINED})
+
+        final_document = next(
+            event["output"]["final_document"]
+            for event in events
+            if event["type"] == "node_end" and event["node"] == "assemble_final_document"
+        )
+        self.assertEqual(final_document, f"{REFINED}\n\n{REFINED}")
+        mock_convert.assert_called_once_with(final_document, "output_file.pdf")
+
+    def test_node_end_only_for_graph_nodes(self, mock_convert):
+        events = self.stream(self.pipeline)
+        nodes = [event["node"] for event in events if event["type"] == "node_end"]
+        self.assertEqual(
+            nodes,
+            [
+                "extract_text_from_pdf",
+                "generate_content_table",
+                "assign_word_counts",
+                "fill_each_chapter",
+                "refine_chapter",
+                "assemble_final_document",
+                "save_as_pdf",
+            ],
+        )
+
+
+@patch("builtins.print")
+@patch("src.generator.pipeline_manager.pipeline.convert_markdown_to_pdf")
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "dummy"}):
+            self.pipeline = TranscriptPipeline(
+                START_STATE, profile_dir=self.tmp_dir.name
+            )
+        self.pipeline.llm = FakeListChatModel(responses=RESPONSES)
+
+    def test_profiles_every_node(self, mock_convert, mock_print):
+        # Nodes calling the model with their config fail if it is not passed
+        config = {"metadata": {"run_id": "run-1"}}
+        result = asyncio.run(self.pipeline.app.ainvoke(START_STATE, config))
+        self.assertEqual(result["final_document"], f"{REFINED}\n\n{REFINED}")
+
+        self.assertEqual(os.listdir(self.tmp_dir.name), ["run-1"])
+        run_dir = os.path.join(self.tmp_dir.name, "run-1")
+        profiled = {profile.rsplit("_", 1)[0] for profile in os.listdir(run_dir)}
+        self.assertEqual(
+            profiled,
+            {
+                "extract_text_from_pdf",
+                "generate_content_table",
+                "assign_word_counts",
+                "fill_each_chapter",
+                "refine_chapter",
+                "should_refine_chapter",
+                "assemble_final_document",
+                "save_as_pdf",
+            },
+        )
+
+    def test_astream_chapters_groups_profiles_by_run(self, mock_convert, mock_print):
+        async def stream_twice():
+            for _ in range(2):
+                self.pipeline.llm = FakeListChatModel(responses=RESPONSES)
+                async for _ in self.pipeline.astream_chapters(START_STATE):
+                    pass
+
+        asyncio.run(stream_twice())
+        run_dirs = os.listdir(self.tmp_dir.name)
+        self.assertEqual(len(run_dirs), 2)
+        for run_dir in run_dirs:
+            profiles = os.listdir(os.path.join(self.tmp_dir.name, run_dir))
+            self.assertEqual(
+                sum(profile.startswith("fill_each_chapter_") for profile in profiles), 1
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
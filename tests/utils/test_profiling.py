@@ -0,0 +1,113 @@
+import asyncio
+import inspect
+import os
+import tempfile
+import tracemalloc
+import unittest
+from unittest.mock import patch
+
+from src.utils.profiling import profile_node
+
+
+def sync_node(state, config):
+    return {"text": state["pdf_path"].upper()}
+
+
+async def async_node(state, config):
+    await asyncio.sleep(0)
+    return {"chapters": {"Chapter 1": "content"}}
+
+
+class TestProfileNode(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def profiles(self):
+        return os.listdir(os.path.join(self.tmp_dir.name, "default"))
+
+    @patch("builtins.print")
+    def test_sync_node(self, mock_print):
+        node = profile_node("sync_node", sync_node, self.tmp_dir.name)
+        self.assertEqual(node({"pdf_path": "a.pdf"}, {}), {"text": "A.PDF"})
+        profiles = self.profiles()
+        self.assertEqual(len(profiles), 1)
+        self.assertTrue(profiles[0].startswith("sync_node_"))
+        self.assertTrue(profiles[0].endswith(".prof"))
+
+    @patch("builtins.print")
+    def test_async_node(self, mock_print):
+        node = profile_node("async_node", async_node, self.tmp_dir.name)
+        self.assertTrue(inspect.iscoroutinefunction(node))
+        result = asyncio.run(node({}, {}))
+        self.assertEqual(result, {"chapters": {"Chapter 1": "content"}})
+        self.assertEqual(len(self.profiles()), 1)
+
+    @patch("builtins.print")
+    def test_keeps_signature(self, mock_print):
+        node = profile_node("sync_node", sync_node, self.tmp_dir.name)
+        self.assertIn("config", inspect.signature(node).parameters)
+
+    @patch("builtins.print")
+    def test_one_profile_per_call(self, mock_print):
+        node = profile_node("sync_node", sync_node, self.tmp_dir.name)
+        node({"pdf_path": "a.pdf"}, {})
+        node({"pdf_path": "b.pdf"}, {})
+        self.assertEqual(len(self.profiles()), 2)
+
+    @patch("builtins.print")
+    def test_stops_tracemalloc(self, mock_print):
+        node = profile_node("sync_node", sync_node, self.tmp_dir.name)
+        node({"pdf_path": "a.pdf"}, {})
+        self.assertFalse(tracemalloc.is_tracing())
+
+    @patch("builtins.print")
+    def test_keeps_external_tracemalloc(self, mock_print):
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+        node = profile_node("sync_node", sync_node, self.tmp_dir.name)
+        node({"pdf_path": "a.pdf"}, {})
+        self.assertTrue(tracemalloc.is_tracing())
+
+    @patch("builtins.print")
+    def test_concurrent_async_nodes(self, mock_print):
+        calls = []
+
+        async def chapter_node(state, config):
+            calls.append(("start", state["chapter"]))
+            await asyncio.sleep(0.01)
+            calls.append(("end", state["chapter"]))
+            return {}
+
+        node = profile_node("chapter_node", chapter_node, self.tmp_dir.name)
+
+        async def run_both():
+            await asyncio.gather(node({"chapter": 1}, {}), node({"chapter": 2}, {}))
+
+        asyncio.run(run_both())
+        self.assertEqual(
+            calls, [("start", 1), ("end", 1), ("start", 2), ("end", 2)]
+        )
+        self.assertEqual(len(self.profiles()), 2)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_nested_async_node(self):
+        inner = profile_node("inner_node", async_node, self.tmp_dir.name)
+
+        async def outer_node(state, config):
+            return await asyncio.gather(inner(state, config), inner(state, config))
+
+        node = profile_node("outer_node", outer_node, self.tmp_dir.name)
+        with patch("builtins.print") as mock_print:
+            result = asyncio.run(asyncio.wait_for(node({}, {}), timeout=5))
+        self.assertEqual(len(result), 2)
+        profiles = self.profiles()
+        self.assertEqual(len(profiles), 1)
+        self.assertTrue(profiles[0].startswith("outer_node_"))
+        mock_print.assert_any_call(
+            "[profile] inner_node skipped: nested in a profiled coroutine"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,23 @@
+import unittest
+
+from src.utils.utils import assemble_chapters
+
+
+class TestAssembleChapters(unittest.TestCase):
+    def test_follows_order(self):
+        chapters = {"Chapter 2": "two", "Chapter 1": "one"}
+        self.assertEqual(
+            assemble_chapters(chapters, ["Chapter 1", "Chapter 2"]), "one\n\ntwo"
+        )
+
+    def test_missing_chapter_raises(self):
+        chapters = {"Chapter 2": "two"}
+        with self.assertRaises(KeyError):
+            assemble_chapters(chapters, ["Chapter 1", "Chapter 2"])
+
+    def test_empty(self):
+        self.assertEqual(assemble_chapters({}, []), "")
+
+
+if __name__ == "__main__":
+    unittest.main()